@@ -14,15 +14,20 @@ Usage:
     assets = mapper.get_supported_assets()
 """
 
-import yaml
+import copy
 import logging
+import functools
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed YAML configs keyed by (path, mtime, size)
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+@dataclass(slots=True, frozen=True)
 class AssetInfo:
     """Information about a trading asset"""
     symbol: str
@@ -31,15 +36,15 @@ class AssetInfo:
     major_pair: bool
     description: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PillarInfo:
     """Information about a scoring pillar"""
     name: str
     description: str
     weight: float
-    indicators: List[str]
+    indicators: Tuple[str, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MappingInfo:
     """Complete mapping information for a series ID"""
     series_id: str
@@ -58,12 +63,22 @@ class AssetMappingSystem:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self._validate_config()
+        self._materialize()
+        self._build_indices()
+        self._install_caches()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
+        import yaml
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # Reuse the parsed config while the file is unchanged
+            stat = self.config_path.stat()
+            cache_key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            if cache_key not in _CONFIG_CACHE:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    _CONFIG_CACHE[cache_key] = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            config = copy.deepcopy(_CONFIG_CACHE[cache_key])
             logger.info(f"Loaded asset mapping config version {config.get('version')}")
             return config
         except FileNotFoundError:
@@ -82,49 +97,67 @@ class AssetMappingSystem:
         
         logger.info("Asset mapping configuration validated successfully")
     
+    def _build_indices(self) -> None:
+        """Build reverse lookup indices over the mappings"""
+        self._series_by_asset: Dict[str, List[str]] = {}
+        self._series_by_pillar: Dict[str, List[str]] = {}
+        for series_id, mapping in self._mappings.items():
+            self._series_by_asset.setdefault(mapping.asset, []).append(series_id)
+            self._series_by_pillar.setdefault(mapping.pillar, []).append(series_id)
+        self._series_set = frozenset(self.config['mappings'])
+    
+    def _install_caches(self) -> None:
+        """Memoize scoring-rule lookups per instance (config is immutable after load)"""
+        self.get_impact_multiplier = functools.lru_cache(maxsize=256)(self._get_impact_multiplier)
+        self.get_frequency_decay = functools.lru_cache(maxsize=256)(self._get_frequency_decay)
+        self.get_pillar_weight = functools.lru_cache(maxsize=256)(self._get_pillar_weight)
+    
+    def _materialize(self) -> None:
+        """Build info objects for every asset, pillar and mapping once"""
+        self._assets: Dict[str, AssetInfo] = {
+            symbol: AssetInfo(
+                symbol=symbol,
+                name=asset_data['name'],
+                type=asset_data['type'],
+                major_pair=asset_data.get('major_pair', False),
+                description=asset_data.get('description', '')
+            )
+            for symbol, asset_data in self.config['assets'].items() if asset_data
+        }
+        self._pillars: Dict[str, PillarInfo] = {
+            pillar_name: PillarInfo(
+                name=pillar_data['name'],
+                description=pillar_data['description'],
+                weight=pillar_data.get('weight', 1.0),
+                indicators=tuple(pillar_data.get('indicators', ()))
+            )
+            for pillar_name, pillar_data in self.config['pillars'].items() if pillar_data
+        }
+        self._mappings: Dict[str, MappingInfo] = {
+            series_id: MappingInfo(
+                series_id=series_id,
+                asset=mapping_data['asset'],
+                pillar=mapping_data['pillar'],
+                key=mapping_data['key'],
+                weight=mapping_data.get('weight', 1.0),
+                frequency=mapping_data.get('frequency', 'monthly'),
+                description=mapping_data.get('description', ''),
+                impact=mapping_data.get('impact', 'medium')
+            )
+            for series_id, mapping_data in self.config['mappings'].items() if mapping_data
+        }
+    
     def get_asset_info(self, symbol: str) -> Optional[AssetInfo]:
         """Get information about an asset"""
-        asset_data = self.config['assets'].get(symbol)
-        if not asset_data:
-            return None
-        
-        return AssetInfo(
-            symbol=symbol,
-            name=asset_data['name'],
-            type=asset_data['type'],
-            major_pair=asset_data.get('major_pair', False),
-            description=asset_data.get('description', '')
-        )
+        return self._assets.get(symbol)
     
     def get_pillar_info(self, pillar_name: str) -> Optional[PillarInfo]:
         """Get information about a pillar"""
-        pillar_data = self.config['pillars'].get(pillar_name)
-        if not pillar_data:
-            return None
-        
-        return PillarInfo(
-            name=pillar_data['name'],
-            description=pillar_data['description'],
-            weight=pillar_data.get('weight', 1.0),
-            indicators=pillar_data.get('indicators', [])
-        )
+        return self._pillars.get(pillar_name)
     
     def get_mapping(self, series_id: str) -> Optional[MappingInfo]:
         """Get complete mapping information for a series ID"""
-        mapping_data = self.config['mappings'].get(series_id)
-        if not mapping_data:
-            return None
-        
-        return MappingInfo(
-            series_id=series_id,
-            asset=mapping_data['asset'],
-            pillar=mapping_data['pillar'],
-            key=mapping_data['key'],
-            weight=mapping_data.get('weight', 1.0),
-            frequency=mapping_data.get('frequency', 'monthly'),
-            description=mapping_data.get('description', ''),
-            impact=mapping_data.get('impact', 'medium')
-        )
+        return self._mappings.get(series_id)
     
     def get_supported_assets(self) -> List[str]:
         """Get list of all supported asset symbols"""
@@ -136,38 +169,30 @@ class AssetMappingSystem:
     
     def get_series_for_asset(self, asset_symbol: str) -> List[str]:
         """Get all series IDs that map to a specific asset"""
-        series_ids = []
-        for series_id, mapping_data in self.config['mappings'].items():
-            if mapping_data['asset'] == asset_symbol:
-                series_ids.append(series_id)
-        return series_ids
+        return list(self._series_by_asset.get(asset_symbol, []))
     
     def get_series_for_pillar(self, pillar_name: str) -> List[str]:
         """Get all series IDs that belong to a specific pillar"""
-        series_ids = []
-        for series_id, mapping_data in self.config['mappings'].items():
-            if mapping_data['pillar'] == pillar_name:
-                series_ids.append(series_id)
-        return series_ids
+        return list(self._series_by_pillar.get(pillar_name, []))
     
-    def get_impact_multiplier(self, impact: str) -> float:
+    def _get_impact_multiplier(self, impact: str) -> float:
         """Get impact multiplier for scoring"""
         multipliers = self.config['scoring_rules']['impact_multipliers']
         return multipliers.get(impact, 1.0)
     
-    def get_frequency_decay(self, frequency: str) -> int:
+    def _get_frequency_decay(self, frequency: str) -> int:
         """Get decay half-life in days for frequency"""
         decay_rules = self.config['scoring_rules']['frequency_decay']
         return decay_rules.get(frequency, 30)
     
-    def get_pillar_weight(self, pillar_name: str) -> float:
+    def _get_pillar_weight(self, pillar_name: str) -> float:
         """Get weight for pillar in final score calculation"""
         weights = self.config['scoring_rules']['pillar_weights']
         return weights.get(pillar_name, 1.0)
     
     def validate_series_id(self, series_id: str) -> bool:
         """Check if a series ID is supported"""
-        return series_id in self.config['mappings']
+        return series_id in self._series_set
     
     def validate_asset(self, asset_symbol: str) -> bool:
         """Check if an asset is supported"""
@@ -175,29 +200,14 @@ class AssetMappingSystem:
     
     def get_mapping_summary(self) -> Dict[str, Any]:
         """Get summary of all mappings"""
-        summary = {
+        return {
             'total_series': len(self.config['mappings']),
             'total_assets': len(self.config['assets']),
             'total_pillars': len(self.config['pillars']),
-            'assets_by_type': {},
-            'series_by_pillar': {},
-            'series_by_asset': {}
+            'assets_by_type': dict(Counter(asset.type for asset in self._assets.values())),
+            'series_by_pillar': {pillar: len(ids) for pillar, ids in self._series_by_pillar.items()},
+            'series_by_asset': {asset: len(ids) for asset, ids in self._series_by_asset.items()}
         }
-        
-        # Count assets by type
-        for asset_data in self.config['assets'].values():
-            asset_type = asset_data['type']
-            summary['assets_by_type'][asset_type] = summary['assets_by_type'].get(asset_type, 0) + 1
-        
-        # Count series by pillar and asset
-        for series_id, mapping_data in self.config['mappings'].items():
-            pillar = mapping_data['pillar']
-            asset = mapping_data['asset']
-            
-            summary['series_by_pillar'][pillar] = summary['series_by_pillar'].get(pillar, 0) + 1
-            summary['series_by_asset'][asset] = summary['series_by_asset'].get(asset, 0) + 1
-        
-        return summary
     
     def export_backend_weights(self) -> Dict[str, Any]:
         """Export weights configuration for backend scoring system"""
@@ -206,31 +216,46 @@ class AssetMappingSystem:
             'pillars': {}
         }
         
-        # Group mappings by pillar and asset
+        # Group mappings by pillar; mappings to unknown pillars are skipped
+        pillars = weights['pillars']
         for pillar_name in self.config['pillars']:
-            weights['pillars'][pillar_name] = {'components': {}}
+            pillars[pillar_name] = {'components': {}}
         
-        for series_id, mapping_data in self.config['mappings'].items():
-            pillar = mapping_data['pillar']
-            key = mapping_data['key']
-            weight = mapping_data['weight']
-            
-            if pillar in weights['pillars']:
-                weights['pillars'][pillar]['components'][key] = weight
+        for mapping in self._mappings.values():
+            pillar = pillars.get(mapping.pillar)
+            if pillar is not None:
+                pillar['components'][mapping.key] = mapping.weight
         
         return weights
     
-    def update_backend_weights_file(self, output_path: str = "backend-scraper/core/scoring/weights.yaml") -> None:
-        """Update the backend weights.yaml file with current mappings"""
+    def update_backend_weights_file(self, output_path: str = "backend-scraper/core/scoring/weights.yaml") -> bool:
+        """Update the backend weights.yaml file with current mappings.
+        
+        Returns False without touching the file when its content is already
+        up to date, so file watchers are not triggered needlessly.
+        """
+        import yaml
+        
         weights = self.export_backend_weights()
+        new_content = yaml.dump(
+            weights, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False, sort_keys=False
+        ).encode('utf-8')
         
         output_file = Path(output_path)
+        if output_file.is_file() and output_file.read_bytes() == new_content:
+            logger.info(f"Backend weights file unchanged, skipping write: {output_file}")
+            return False
+        
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(weights, f, default_flow_style=False, sort_keys=False)
+        # Write to a temporary file and rename so readers never see a partial file
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        tmp_file.write_bytes(new_content)
+        tmp_file.replace(output_file)
         
         logger.info(f"Updated backend weights file: {output_file}")
+        return True
 
 def main():
     """CLI interface for asset mapping system"""
@@ -289,8 +314,10 @@ def main():
             print(f"❌ Asset {args.asset_info} not found")
     
     elif args.update_backend:
-        mapper.update_backend_weights_file()
-        print("✅ Backend weights file updated")
+        if mapper.update_backend_weights_file():
+            print("✅ Backend weights file updated")
+        else:
+            print("✅ Backend weights file already up to date")
     
     else:
         print("Use --help for available commands")
@@ -11,31 +11,41 @@ Usage:
 """
 
 import asyncio
+import copy
+import functools
+import heapq
 import logging
+import os
+import shlex
 import signal
 import sys
 import time
-import yaml
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
-import subprocess
-import json
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('automation.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed YAML configs keyed by (path, mtime, size)
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Maximum amount of stdout/stderr retained per job run
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+def _configure_logging(log_file: str = 'automation.log') -> None:
+    """Configure root logging with file and console handlers"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+@dataclass(slots=True)
 class JobConfig:
     """Configuration for a scheduled job"""
     name: str
@@ -45,9 +55,11 @@ class JobConfig:
     timeout: int = 300  # 5 minutes default
     retry_count: int = 3
     retry_delay: int = 60  # seconds
-    environment: Dict[str, str] = None
+    environment: Dict[str, str] = field(default_factory=dict)
+    shell: bool = False  # Run through /bin/sh (needed for pipes, redirects, globbing)
+    matcher: Optional["ScheduleMatcher"] = field(default=None, repr=False, compare=False)
 
-@dataclass
+@dataclass(slots=True)
 class JobResult:
     """Result of a job execution"""
     job_name: str
@@ -59,9 +71,61 @@ class JobResult:
     stderr: str
     error_message: Optional[str] = None
 
+@dataclass(slots=True, frozen=True)
+class ScheduleMatcher:
+    """Precompiled cron schedule; a field of None matches any value.
+    
+    Weekdays follow cron numbering (0 = Sunday).
+    """
+    minute: Optional[FrozenSet[int]]
+    hour: Optional[FrozenSet[int]]
+    day: Optional[FrozenSet[int]]
+    month: Optional[FrozenSet[int]]
+    weekday: Optional[FrozenSet[int]]
+    
+    def should_run(self, current_time: datetime) -> bool:
+        """Check if the schedule fires at current time"""
+        return (
+            (self.minute is None or current_time.minute in self.minute) and
+            (self.hour is None or current_time.hour in self.hour) and
+            (self.day is None or current_time.day in self.day) and
+            (self.month is None or current_time.month in self.month) and
+            (self.weekday is None or current_time.isoweekday() % 7 in self.weekday)
+        )
+    
+    def next_fire_time(self, after: datetime) -> datetime:
+        """Return the first matching minute strictly after ``after``"""
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        
+        while t < limit:
+            if self.month is not None and t.month not in self.month:
+                # Jump to the first day of the next month
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif ((self.day is not None and t.day not in self.day) or
+                  (self.weekday is not None and t.isoweekday() % 7 not in self.weekday)):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif self.hour is not None and t.hour not in self.hour:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif self.minute is not None and t.minute not in self.minute:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        
+        raise ValueError("Schedule never fires")
+
 class CronParser:
     """Simple cron expression parser"""
     
+    # Inclusive value range of each cron field
+    FIELD_RANGES = {
+        'minute': (0, 59),
+        'hour': (0, 23),
+        'day': (1, 31),
+        'month': (1, 12),
+        'weekday': (0, 7),  # 0 and 7 are Sunday
+    }
+    
     @staticmethod
     def parse_schedule(schedule: str) -> Dict[str, Any]:
         """Parse cron schedule string"""
@@ -77,35 +141,53 @@ class CronParser:
             'weekday': parts[4]
         }
     
+    @staticmethod
+    def _expand_field(cron_field: str, low: int, high: int) -> Optional[FrozenSet[int]]:
+        """Expand a single cron field into the set of matching values"""
+        # Supports *, N, A-B, with optional /step, and comma-separated lists
+        if cron_field == '*':
+            return None
+        
+        values = set()
+        for part in cron_field.split(','):
+            base, has_step, step_str = part.strip().partition('/')
+            step = int(step_str) if has_step else 1
+            if step < 1:
+                raise ValueError(f"Invalid step in cron field: {cron_field}")
+            
+            if base == '*':
+                start, end = low, high
+            elif '-' in base:
+                start, end = (int(v) for v in base.split('-', 1))
+            else:
+                start = int(base)
+                end = high if has_step else start
+            
+            if start < low or end > high or start > end:
+                raise ValueError(f"Value out of range in cron field: {cron_field}")
+            values.update(range(start, end + 1, step))
+        
+        return frozenset(values)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def compile(schedule: str) -> ScheduleMatcher:
+        """Parse a cron schedule once into a reusable matcher"""
+        parsed = CronParser.parse_schedule(schedule)
+        fields = {
+            name: CronParser._expand_field(parsed[name], low, high)
+            for name, (low, high) in CronParser.FIELD_RANGES.items()
+        }
+        # Cron accepts both 0 and 7 for Sunday
+        if fields['weekday'] is not None and 7 in fields['weekday']:
+            fields['weekday'] = (fields['weekday'] - {7}) | {0}
+        return ScheduleMatcher(**fields)
+    
     @staticmethod
     def should_run(schedule: str, current_time: datetime) -> bool:
         """Check if job should run at current time"""
         try:
-            parsed = CronParser.parse_schedule(schedule)
-            
-            # Simple implementation - supports * and specific values
-            def matches(cron_field: str, time_value: int) -> bool:
-                if cron_field == '*':
-                    return True
-                if '/' in cron_field:
-                    # Handle */N syntax
-                    if cron_field.startswith('*/'):
-                        interval = int(cron_field[2:])
-                        return time_value % interval == 0
-                if ',' in cron_field:
-                    # Handle comma-separated values
-                    values = [int(v.strip()) for v in cron_field.split(',')]
-                    return time_value in values
-                # Single value
-                return int(cron_field) == time_value
-            
-            return (
-                matches(parsed['minute'], current_time.minute) and
-                matches(parsed['hour'], current_time.hour) and
-                matches(parsed['day'], current_time.day) and
-                matches(parsed['month'], current_time.month) and
-                matches(parsed['weekday'], current_time.weekday())
-            )
+            return CronParser.compile(schedule).should_run(current_time)
         except Exception as e:
             logger.error(f"Error parsing schedule '{schedule}': {e}")
             return False
@@ -114,45 +196,48 @@ class JobExecutor:
     """Executes scheduled jobs with error handling and retries"""
     
     def __init__(self, max_workers: int = 4):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.running_jobs = {}
+        self._semaphore = asyncio.Semaphore(max_workers)  # Bounds concurrent subprocesses
+        self._base_env = os.environ.copy()  # Snapshot once; jobs only add overrides
+        self.running_jobs: Dict[str, asyncio.Task] = {}
     
     async def execute_job(self, job_config: JobConfig) -> JobResult:
         """Execute a job with timeout and retry logic"""
         logger.info(f"Starting job: {job_config.name}")
         start_time = datetime.now()
         
-        for attempt in range(job_config.retry_count + 1):
+        last_result: Optional[JobResult] = None
+        
+        for attempt in range(max(job_config.retry_count, 0) + 1):
             try:
                 if attempt > 0:
                     logger.info(f"Retrying job {job_config.name} (attempt {attempt + 1})")
                     await asyncio.sleep(job_config.retry_delay)
                 
                 # Execute command
-                result = await self._run_command(job_config)
+                async with self._semaphore:
+                    last_result = await self._run_command(job_config)
                 
-                if result.success:
+                if last_result.success:
                     logger.info(f"Job {job_config.name} completed successfully")
-                    return result
-                else:
-                    logger.warning(f"Job {job_config.name} failed (attempt {attempt + 1}): {result.error_message}")
-                    if attempt == job_config.retry_count:
-                        return result
+                    return last_result
+                logger.warning(f"Job {job_config.name} failed (attempt {attempt + 1}): {last_result.error_message}")
                         
             except Exception as e:
                 error_msg = f"Exception in job {job_config.name}: {str(e)}"
                 logger.error(error_msg)
-                if attempt == job_config.retry_count:
-                    return JobResult(
-                        job_name=job_config.name,
-                        start_time=start_time,
-                        end_time=datetime.now(),
-                        success=False,
-                        exit_code=-1,
-                        stdout="",
-                        stderr="",
-                        error_message=error_msg
-                    )
+                last_result = JobResult(
+                    job_name=job_config.name,
+                    start_time=start_time,
+                    end_time=datetime.now(),
+                    success=False,
+                    exit_code=-1,
+                    stdout="",
+                    stderr="",
+                    error_message=error_msg
+                )
+        
+        # Retries exhausted: report the last failure
+        return last_result
     
     async def _run_command(self, job_config: JobConfig) -> JobResult:
         """Run a single command"""
@@ -160,22 +245,34 @@ class JobExecutor:
         
         try:
             # Prepare environment
-            env = dict(os.environ)
+            env = self._base_env
             if job_config.environment:
-                env.update(job_config.environment)
+                env = {**self._base_env, **job_config.environment}
             
-            # Execute command
-            process = await asyncio.create_subprocess_shell(
-                job_config.command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env
-            )
+            # Execute command directly unless the job opts into a shell
+            if job_config.shell:
+                process = await asyncio.create_subprocess_shell(
+                    job_config.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *shlex.split(job_config.command),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env
+                )
             
-            # Wait with timeout
+            # Wait with timeout, keeping only the tail of each output stream
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_tail(process.stdout),
+                        self._read_tail(process.stderr),
+                        process.wait()
+                    ),
                     timeout=job_config.timeout
                 )
             except asyncio.TimeoutError:
@@ -192,8 +289,8 @@ class JobExecutor:
                 end_time=end_time,
                 success=success,
                 exit_code=process.returncode,
-                stdout=stdout.decode('utf-8') if stdout else "",
-                stderr=stderr.decode('utf-8') if stderr else "",
+                stdout=stdout,
+                stderr=stderr,
                 error_message=None if success else f"Command failed with exit code {process.returncode}"
             )
             
@@ -209,6 +306,19 @@ class JobExecutor:
                 error_message=str(e)
             )
 
+    @staticmethod
+    async def _read_tail(stream: asyncio.StreamReader, limit: int = OUTPUT_TAIL_BYTES) -> str:
+        """Drain a stream, keeping only its last ``limit`` bytes"""
+        buf = bytearray()
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            buf += chunk
+            if len(buf) > limit:
+                del buf[:-limit]
+        return buf.decode('utf-8', errors='replace')
+
 class AutomationScheduler:
     """Main scheduler for automated tasks"""
     
@@ -217,17 +327,21 @@ class AutomationScheduler:
         self.config = self._load_config()
         self.executor = JobExecutor(max_workers=self.config.get('max_workers', 4))
         self.running = False
-        self.job_history = []
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self.job_history = deque(maxlen=100)  # Keep only last 100 results
+        self._wakeup: Optional[asyncio.Event] = None
     
     def _load_config(self) -> Dict[str, Any]:
         """Load scheduler configuration"""
+        import yaml
+        
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # Reuse the parsed config while the file is unchanged
+            stat = self.config_path.stat()
+            cache_key = (str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            if cache_key not in _CONFIG_CACHE:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    _CONFIG_CACHE[cache_key] = yaml.safe_load(f)
+            config = copy.deepcopy(_CONFIG_CACHE[cache_key])
             logger.info(f"Loaded scheduler config from {self.config_path}")
             return config
         except FileNotFoundError:
@@ -240,7 +354,6 @@ class AutomationScheduler:
     def _default_config(self) -> Dict[str, Any]:
         """Default configuration"""
         return {
-            'check_interval': 60,  # Check every minute
             'max_workers': 4,
             'jobs': [
                 {
@@ -270,10 +383,19 @@ class AutomationScheduler:
             ]
         }
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum: int) -> None:
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` or until a shutdown signal arrives"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
     
     def _parse_jobs(self) -> List[JobConfig]:
         """Parse job configurations"""
@@ -288,11 +410,15 @@ class AutomationScheduler:
                     timeout=job_data.get('timeout', 300),
                     retry_count=job_data.get('retry_count', 3),
                     retry_delay=job_data.get('retry_delay', 60),
-                    environment=job_data.get('environment', {})
+                    environment=job_data.get('environment', {}),
+                    shell=job_data.get('shell', False),
+                    matcher=CronParser.compile(job_data['schedule'])
                 )
                 jobs.append(job)
             except KeyError as e:
                 logger.error(f"Invalid job configuration, missing key: {e}")
+            except ValueError as e:
+                logger.error(f"Invalid schedule for job {job_data.get('name')}: {e}")
         
         return jobs
     
@@ -300,6 +426,12 @@ class AutomationScheduler:
         """Main scheduler loop"""
         logger.info("Starting automation scheduler")
         self.running = True
+        self._wakeup = asyncio.Event()
+        
+        # Setup signal handlers on the event loop
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._signal_handler, sig)
         jobs = self._parse_jobs()
         
         logger.info(f"Loaded {len(jobs)} jobs:")
@@ -307,48 +439,69 @@ class AutomationScheduler:
             status = "enabled" if job.enabled else "disabled"
             logger.info(f"  - {job.name}: {job.schedule} ({status})")
         
-        check_interval = self.config.get('check_interval', 60)
+        # Min-heap of (next fire time, job index) for enabled jobs
+        now = datetime.now(timezone.utc)
+        self._heap = []
+        for index, job in enumerate(jobs):
+            if not job.enabled:
+                continue
+            try:
+                self._heap.append((job.matcher.next_fire_time(now), index))
+            except ValueError as e:
+                logger.error(f"Job {job.name} will never run: {e}")
+        heapq.heapify(self._heap)
         
         while self.running:
             try:
-                current_time = datetime.now()
+                if not self._heap:
+                    await self._sleep(60)
+                    continue
                 
-                # Check which jobs should run
-                for job in jobs:
-                    if not job.enabled:
-                        continue
-                    
-                    if CronParser.should_run(job.schedule, current_time):
-                        # Avoid running the same job multiple times
-                        if job.name not in self.executor.running_jobs:
-                            logger.info(f"Scheduling job: {job.name}")
-                            task = asyncio.create_task(self.executor.execute_job(job))
-                            self.executor.running_jobs[job.name] = task
-                            
-                            # Add callback to clean up and log result
-                            task.add_done_callback(
-                                lambda t, job_name=job.name: self._job_completed(job_name, t)
-                            )
+                # Sleep until the earliest job is due; re-check at least once a minute
+                delay = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+                if delay > 0:
+                    await self._sleep(min(delay, 60))
+                    continue
                 
-                # Wait before next check
-                await asyncio.sleep(check_interval)
+                current_time = datetime.now(timezone.utc)
+                while self._heap and self._heap[0][0] <= current_time:
+                    _, index = heapq.heappop(self._heap)
+                    job = jobs[index]
+                    self._dispatch_job(job)
+                    heapq.heappush(self._heap, (job.matcher.next_fire_time(current_time), index))
                 
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
-                await asyncio.sleep(check_interval)
+                await self._sleep(60)
         
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
         logger.info("Scheduler stopped")
     
+    def _dispatch_job(self, job: JobConfig) -> None:
+        """Start a job unless a previous run is still active"""
+        # Avoid running the same job multiple times
+        if job.name in self.executor.running_jobs:
+            return
+        
+        logger.info(f"Scheduling job: {job.name}")
+        task = asyncio.create_task(self.executor.execute_job(job))
+        self.executor.running_jobs[job.name] = task
+        
+        # Add callback to clean up and log result
+        task.add_done_callback(
+            lambda t, job_name=job.name: self._job_completed(job_name, t)
+        )
+    
     def _job_completed(self, job_name: str, task: asyncio.Task):
         """Handle job completion"""
         try:
             result = task.result()
+            if result is None:
+                logger.error(f"Job {job_name} finished without a result")
+                return
             self.job_history.append(result)
             
-            # Keep only last 100 results
-            if len(self.job_history) > 100:
-                self.job_history = self.job_history[-100:]
-            
             # Log result
             if result.success:
                 logger.info(f"Job {job_name} completed successfully in {result.end_time - result.start_time}")
@@ -371,14 +524,23 @@ class AutomationScheduler:
             'recent_results': [
                 {
                     'job_name': r.job_name,
-                    'start_time': r.start_time.isoformat(),
+                    'start_time': r.start_time,
                     'success': r.success,
                     'duration': (r.end_time - r.start_time).total_seconds()
                 }
-                for r in self.job_history[-10:]  # Last 10 results
+                for r in list(self.job_history)[-10:]  # Last 10 results
             ]
         }
 
+def _dumps_json(data: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2, default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o))
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+
 async def main():
     """Main entry point"""
     import argparse
@@ -390,11 +552,15 @@ async def main():
     
     args = parser.parse_args()
     
+    # The status path should not create or touch the log file
+    if not args.status:
+        _configure_logging()
+    
     scheduler = AutomationScheduler(args.config)
     
     if args.status:
         status = scheduler.get_status()
-        print(json.dumps(status, indent=2))
+        print(_dumps_json(status))
         return
     
     if args.daemon:
@@ -411,5 +577,4 @@ async def main():
     return 0
 
 if __name__ == "__main__":
-    import os
     exit(asyncio.run(main()))
@@ -10,16 +10,23 @@ Usage:
     python bridge_scraper_to_backend.py [--dry-run] [--series-id SERIES_ID]
 """
 
+import csv
+import io
+import itertools
+import json
 import sqlite3
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 from dataclasses import dataclass
 
 import requests
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker
 
 # Import backend models
@@ -32,13 +39,27 @@ from infra.settings import settings
 from core.scoring.engine import compute_score
 
 # Import asset mapping system
-from asset_mapping_system import AssetMappingSystem
+from asset_mapping_system import AssetMappingSystem, MappingInfo
+
+try:
+    import orjson  # optional: faster JSON serialization
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of events written and committed per backend transaction
+BATCH_SIZE = 5000
+
+# Number of scraper rows read from SQLite per chunk
+FETCH_SIZE = 10000
+
+# Worker threads writing asset partitions concurrently (1 = serial)
+BRIDGE_PARALLEL = max(1, int(os.environ.get("BRIDGE_PARALLEL", "1")))
+
+@dataclass(slots=True, frozen=True)
 class ScraperEvent:
     """Scraper event structure from SQLite"""
     series_id: str
@@ -50,6 +71,14 @@ class ScraperEvent:
     impact: str
     release_time_utc: str
     provider: str
+    release_epoch: Optional[int] = None  # whole-second release_time_utc as Unix seconds, computed by SQLite
+    
+    @property
+    def release_datetime(self) -> datetime:
+        """Release time as an aware datetime"""
+        if self.release_epoch is not None:
+            return datetime.fromtimestamp(self.release_epoch, tz=timezone.utc)
+        return datetime.fromisoformat(self.release_time_utc.replace('Z', '+00:00'))
 
 class AssetMapper:
     """Maps scraper series_ids to trading assets and pillars using the Asset Mapping System"""
@@ -79,6 +108,10 @@ class AssetMapper:
     def get_frequency_decay(self, frequency: str) -> int:
         """Get decay half-life in days for frequency"""
         return self.mapping_system.get_frequency_decay(frequency)
+    
+    def get_impact_multipliers(self) -> Dict[str, float]:
+        """Get all configured impact multipliers"""
+        return dict(self.mapping_system.config['scoring_rules']['impact_multipliers'])
 
 class ScoreConverter:
     """Converts scraper scores (-2 to +2) to backend scores (-24 to +24)"""
@@ -86,14 +119,8 @@ class ScoreConverter:
     @staticmethod
     def convert_score(scraper_score: float) -> int:
         """Convert scraper score (-2 to +2) to backend score (-24 to +24)"""
-        # Clamp input to valid range
-        scraper_score = max(-2.0, min(2.0, scraper_score))
-        
-        # Scale: -2→-24, 0→0, +2→+24
-        backend_score = int(scraper_score * 12)
-        
-        # Ensure within backend range
-        return max(-24, min(24, backend_score))
+        # Clamp to the scraper range and scale: -2→-24, 0→0, +2→+24 (already within backend range)
+        return int(max(-2.0, min(2.0, scraper_score)) * 12)
 
 class BridgeProcessor:
     """Main processor for bridging scraper data to backend"""
@@ -105,183 +132,455 @@ class BridgeProcessor:
 
         # Setup asset mapper
         self.asset_mapper = AssetMapper(asset_config_path)
+        self._impact_mul = self.asset_mapper.get_impact_multipliers()
+        self._series_profiles: Dict[str, Optional[Tuple[MappingInfo, float, Dict]]] = {}
 
         # Setup backend database connection
-        self.backend_engine = create_engine(self.backend_db_url)
+        self.backend_engine = create_engine(self.backend_db_url, **_engine_options(self.backend_db_url))
         self.BackendSession = sessionmaker(bind=self.backend_engine)
+        
+        # SQLite allows a single writer, so parallel writes only apply to server databases
+        self.parallel = 1 if self.backend_engine.dialect.name == "sqlite" else BRIDGE_PARALLEL
 
         # Create tables if they don't exist
         Base.metadata.create_all(bind=self.backend_engine)
         
-    def load_scraper_events(self, series_id: Optional[str] = None) -> List[ScraperEvent]:
-        """Load events from scraper SQLite database"""
+        # Known backend asset ids by symbol, so repeated symbols skip the database
+        with self.BackendSession() as session:
+            self._asset_id_cache: Dict[str, int] = dict(session.query(Asset.symbol, Asset.id))
+        
+    def load_scraper_events(self, series_id: Optional[str] = None) -> Iterator[ScraperEvent]:
+        """Stream events from scraper SQLite database, fetching FETCH_SIZE rows at a time"""
         try:
             conn = sqlite3.connect(self.scraper_db_path)
+        except sqlite3.Error as e:
+            logger.error(f"Error loading scraper events: {e}")
+            return
+        
+        try:
+            # Let SQLite memory-map the file and keep a larger page cache
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            
+            cursor = conn.cursor()
+            cursor.row_factory = lambda _cursor, row: ScraperEvent(*row)
             
             if series_id:
                 query = """
                 SELECT series_id, release_date, vintage, actual, consensus, previous,
-                       impact, release_time_utc, provider
+                       impact, release_time_utc, provider,
+                       CASE WHEN instr(release_time_utc, '.') = 0
+                            THEN CAST(strftime('%s', release_time_utc) AS INTEGER) END AS release_epoch
                 FROM events 
                 WHERE series_id = ?
                 ORDER BY release_date DESC, vintage DESC
                 """
-                cursor = conn.execute(query, (series_id,))
+                cursor.execute(query, (series_id,))
             else:
                 query = """
                 SELECT series_id, release_date, vintage, actual, consensus, previous,
-                       impact, release_time_utc, provider
+                       impact, release_time_utc, provider,
+                       CASE WHEN instr(release_time_utc, '.') = 0
+                            THEN CAST(strftime('%s', release_time_utc) AS INTEGER) END AS release_epoch
                 FROM events 
                 ORDER BY release_date DESC, vintage DESC
                 """
-                cursor = conn.execute(query)
+                cursor.execute(query)
             
-            events = []
-            for row in cursor.fetchall():
-                events.append(ScraperEvent(*row))
+            total = 0
+            while events := cursor.fetchmany(FETCH_SIZE):
+                total += len(events)
+                yield from events
             
-            conn.close()
-            logger.info(f"Loaded {len(events)} events from scraper database")
-            return events
+            logger.info(f"Loaded {total} events from scraper database")
             
         except sqlite3.Error as e:
             logger.error(f"Error loading scraper events: {e}")
-            return []
+        finally:
+            conn.close()
     
-    def ensure_asset_exists(self, session, symbol: str) -> Asset:
-        """Ensure asset exists in backend database"""
+    def ensure_asset_exists(self, session, symbol: str) -> int:
+        """Ensure asset exists in backend database, returning its id"""
+        kind = "currency" if len(symbol) == 3 else "commodity"
+        if session.get_bind().dialect.name == "postgresql":
+            # Insert-or-skip in one round trip; no row comes back if the asset already exists
+            asset_id = session.execute(
+                pg_insert(Asset).values(symbol=symbol, kind=kind)
+                .on_conflict_do_nothing(index_elements=["symbol"])
+                .returning(Asset.id)
+            ).scalar()
+            if asset_id is not None:
+                logger.info(f"Created new asset: {symbol}")
+                return asset_id
+        
         asset = session.query(Asset).filter_by(symbol=symbol).first()
         if not asset:
-            asset = Asset(symbol=symbol, kind="currency" if len(symbol) == 3 else "commodity")
+            asset = Asset(symbol=symbol, kind=kind)
             session.add(asset)
-            session.commit()
-            session.refresh(asset)
+            session.flush()  # Populates asset.id without committing
             logger.info(f"Created new asset: {symbol}")
-        return asset
+        return asset.id
+    
+    def _series_profile(self, series_id: str) -> Optional[Tuple[MappingInfo, float, Dict]]:
+        """Per-series constants for transform_event: (mapping, impact multiplier, static metadata)"""
+        if series_id not in self._series_profiles:
+            mapping_info = self.asset_mapper.get_mapping_info(series_id)
+            if mapping_info:
+                impact_multiplier = self._impact_mul.get(mapping_info.impact, 1.0)
+                self._series_profiles[series_id] = (mapping_info, impact_multiplier, {
+                    "mapping_weight": mapping_info.weight,
+                    "impact_multiplier": impact_multiplier,
+                    "frequency": mapping_info.frequency,
+                    "description": mapping_info.description
+                })
+            else:
+                self._series_profiles[series_id] = None
+        return self._series_profiles[series_id]
     
     def transform_event(self, scraper_event: ScraperEvent) -> Optional[Dict]:
         """Transform scraper event to backend format using enhanced mapping system"""
-        mapping_info = self.asset_mapper.get_mapping_info(scraper_event.series_id)
-        if not mapping_info:
+        profile = self._series_profile(scraper_event.series_id)
+        if not profile:
             logger.warning(f"No mapping found for series_id: {scraper_event.series_id}")
             return None
-
-        # Calculate enhanced score using mapping configuration
-        surprise = 0.0
-        if scraper_event.consensus is not None:
-            surprise = scraper_event.actual - scraper_event.consensus
-
-        # Enhanced scoring with impact and frequency considerations
-        impact_multiplier = self.asset_mapper.get_impact_multiplier(mapping_info.impact)
-        base_weight = mapping_info.weight
-
-        # Normalize surprise based on actual value magnitude
-        if abs(scraper_event.actual) > 0:
-            normalized_surprise = surprise / max(abs(scraper_event.actual), 1.0)
+        mapping_info, impact_multiplier, static_metadata = profile
+        actual = scraper_event.actual
+        
+        # Surprise normalized by the actual value's magnitude
+        if scraper_event.consensus is not None and abs(actual) > 0:
+            normalized_surprise = (actual - scraper_event.consensus) / max(abs(actual), 1.0)
         else:
             normalized_surprise = 0.0
-
-        # Apply impact and weight multipliers
-        score_raw = normalized_surprise * impact_multiplier * base_weight
-
-        # Clamp to scraper range and convert to backend range
-        score_raw = max(-2.0, min(2.0, score_raw))
-        score_backend = ScoreConverter.convert_score(score_raw)
-
+        
+        # Apply impact and weight multipliers, clamp to scraper range and scale to backend range
+        score_raw = normalized_surprise * impact_multiplier * mapping_info.weight
+        score_backend = int(max(-2.0, min(2.0, score_raw)) * 12)
+        
+        # Literal dicts compile to a single constant-keys build, which benchmarks
+        # about twice as fast as dict(zip(keys, values)); the per-series part is prebuilt
         return {
             "asset_symbol": mapping_info.asset,
             "pillar": mapping_info.pillar,
             "key": mapping_info.key,
             "value": score_backend,
-            "timestamp": datetime.fromisoformat(scraper_event.release_time_utc.replace('Z', '+00:00')),
+            "timestamp": scraper_event.release_datetime,
             "metadata": {
                 "series_id": scraper_event.series_id,
-                "actual": scraper_event.actual,
+                "actual": actual,
                 "consensus": scraper_event.consensus,
                 "previous": scraper_event.previous,
                 "impact": scraper_event.impact,
                 "provider": scraper_event.provider,
                 "vintage": scraper_event.vintage,
-                "mapping_weight": mapping_info.weight,
-                "impact_multiplier": impact_multiplier,
-                "frequency": mapping_info.frequency,
-                "description": mapping_info.description
+                **static_metadata
             }
         }
     
-    def process_events(self, events: List[ScraperEvent], dry_run: bool = False) -> Dict[str, int]:
-        """Process scraper events and insert into backend"""
+    def ensure_assets_exist(self, session, symbols: Set[str]) -> Dict[str, int]:
+        """Ensure all assets exist in backend database, returning symbol → id"""
+        asset_ids = {symbol: self._asset_id_cache[symbol] for symbol in symbols if symbol in self._asset_id_cache}
+        missing = symbols - asset_ids.keys()
+        if missing:
+            asset_ids.update(session.query(Asset.symbol, Asset.id).filter(Asset.symbol.in_(missing)))
+        for symbol in symbols - asset_ids.keys():
+            asset_ids[symbol] = self.ensure_asset_exists(session, symbol)
+        return asset_ids
+    
+    def process_events(self, events: Iterable[ScraperEvent], dry_run: bool = False,
+                       skip_scoring: bool = False) -> Dict[str, int]:
+        """Process scraper events and insert into backend, FETCH_SIZE events at a time"""
         stats = {"processed": 0, "skipped": 0, "errors": 0}
+        touched_assets: Set[int] = set()
+        events = iter(events)
+        while chunk := list(itertools.islice(events, FETCH_SIZE)):
+            chunk_stats, chunk_assets = self._process_chunk(chunk, dry_run)
+            touched_assets |= chunk_assets
+            for key, count in chunk_stats.items():
+                stats[key] += count
+        
+        # Scores aggregate over all indicators of an asset, so compute each once per run
+        if touched_assets and not skip_scoring:
+            self.compute_scores(touched_assets)
+        return stats
+    
+    def compute_scores(self, asset_ids: Iterable[int]) -> None:
+        """Recompute backend scores for the given assets in one transaction"""
+        with self.BackendSession() as session:
+            try:
+                for asset_id in asset_ids:
+                    compute_score(session, asset_id)
+                session.commit()
+            except Exception as e:
+                logger.error(f"Error computing scores: {e}")
+                session.rollback()
+    
+    def _process_chunk(self, events: List[ScraperEvent], dry_run: bool) -> Tuple[Dict[str, int], Set[int]]:
+        """Transform one chunk of scraper events and write it to the backend, returning stats and touched asset ids"""
+        stats = {"processed": 0, "skipped": 0, "errors": 0}
+        touched_assets: Set[int] = set()
+        
+        # Transform the whole chunk up front so the backend is written in batches
+        pending = []
+        for event in events:
+            try:
+                transformed = self.transform_event(event)
+            except Exception as e:
+                logger.error(f"Error processing event {event.series_id}: {e}")
+                stats["errors"] += 1
+                continue
+            
+            if not transformed:
+                stats["skipped"] += 1
+                continue
+            
+            if dry_run:
+                logger.info(f"DRY RUN: Would process {event.series_id} → {transformed['asset_symbol']}")
+                stats["processed"] += 1
+                continue
+            
+            pending.append((event, transformed))
+        
+        if not pending:
+            return stats, touched_assets
+        
+        with self.BackendSession() as session:
+            try:
+                asset_ids = self.ensure_assets_exist(session, {t["asset_symbol"] for _, t in pending})
+                session.commit()
+                self._asset_id_cache.update(asset_ids)
+            except Exception as e:
+                logger.error(f"Error creating backend assets: {e}")
+                session.rollback()
+                stats["errors"] += len(pending)
+                return stats, touched_assets
+        
+        if self.parallel == 1:
+            partitions = [pending]
+        else:
+            # Keep each asset in one partition so duplicate (asset_id, ts) keys are detected by a single writer
+            by_asset: Dict[str, List[Tuple[ScraperEvent, Dict]]] = {}
+            for item in pending:
+                by_asset.setdefault(item[1]["asset_symbol"], []).append(item)
+            partitions = list(by_asset.values())
+        
+        if len(partitions) == 1:
+            results = [self._write_partition(partitions[0], asset_ids)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+                futures = [executor.submit(self._write_partition, part, asset_ids) for part in partitions]
+                results = [future.result() for future in as_completed(futures)]
+        
+        # Each worker reports its own touched assets; they are merged here, on the calling thread
+        for partition_stats, partition_assets in results:
+            touched_assets |= partition_assets
+            for key, count in partition_stats.items():
+                stats[key] += count
         
+        return stats, touched_assets
+    
+    def _write_partition(self, pending: List[Tuple[ScraperEvent, Dict]],
+                         asset_ids: Dict[str, int]) -> Tuple[Dict[str, int], Set[int]]:
+        """Write transformed events in BATCH_SIZE transactions on a dedicated session"""
+        stats = {"processed": 0, "skipped": 0, "errors": 0}
+        partition_assets: Set[int] = set()
         with self.BackendSession() as session:
-            for event in events:
+            for start in range(0, len(pending), BATCH_SIZE):
+                batch = pending[start:start + BATCH_SIZE]
+                touched_assets: Set[int] = set()
                 try:
-                    transformed = self.transform_event(event)
-                    if not transformed:
-                        stats["skipped"] += 1
-                        continue
-                    
-                    if dry_run:
-                        logger.info(f"DRY RUN: Would process {event.series_id} → {transformed['asset_symbol']}")
-                        stats["processed"] += 1
-                        continue
-                    
-                    # Ensure asset exists
-                    asset = self.ensure_asset_exists(session, transformed["asset_symbol"])
-                    
-                    # Create backend event
-                    backend_event = BackendEvent(
-                        trace_id=str(uuid4()),
-                        source="scraper_bridge",
-                        asset_id=asset.id,
-                        kind="indicator",
-                        ingested_at=transformed["timestamp"],
-                        payload={
-                            "key": transformed["key"],
-                            "value": transformed["value"],
-                            "metadata": transformed["metadata"]
-                        }
-                    )
-                    
-                    # Check if event already exists
-                    existing = session.query(BackendEvent).filter_by(
-                        asset_id=asset.id,
-                        kind="indicator",
-                        ingested_at=transformed["timestamp"]
-                    ).first()
-                    
-                    if existing:
-                        logger.debug(f"Event already exists for {transformed['asset_symbol']} at {transformed['timestamp']}")
-                        stats["skipped"] += 1
-                        continue
-                    
-                    session.add(backend_event)
-                    session.commit()
-                    session.refresh(backend_event)
-                    
-                    # Create indicator
-                    indicator = Indicator(
-                        asset_id=asset.id,
-                        key=transformed["key"],
-                        ts=transformed["timestamp"],
-                        value=transformed["value"],
-                        meta=transformed["metadata"]
-                    )
-                    session.merge(indicator)  # Use merge to handle duplicates
+                    batch_stats = self._write_batch(session, batch, asset_ids, touched_assets)
                     session.commit()
-                    
-                    # Recompute score for asset
-                    compute_score(session, asset.id)
-                    
-                    stats["processed"] += 1
-                    logger.info(f"Processed {event.series_id} → {transformed['asset_symbol']} (score: {transformed['value']})")
-                    
                 except Exception as e:
-                    logger.error(f"Error processing event {event.series_id}: {e}")
-                    stats["errors"] += 1
+                    # The whole batch is rolled back together
+                    logger.error(f"Error processing batch of {len(batch)} events: {e}")
                     session.rollback()
+                    stats["errors"] += len(batch)
+                    continue
+                
+                partition_assets |= touched_assets
+                for key, count in batch_stats.items():
+                    stats[key] += count
+                logger.info("Committed batch of %d events (%d processed, %d skipped)",
+                            len(batch), batch_stats["processed"], batch_stats["skipped"])
+        
+        return stats, partition_assets
+    
+    def _write_batch(self, session, batch: List[Tuple[ScraperEvent, Dict]], asset_ids: Dict[str, int],
+                     touched_assets: Set[int]) -> Dict[str, int]:
+        """Insert one batch of transformed events and their indicators, recording affected assets"""
+        stats = {"processed": 0, "skipped": 0}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Preload existing (asset_id, timestamp) keys with a single query
+        existing = {
+            (asset_id, _as_utc(ingested_at))
+            for asset_id, ingested_at in session.query(BackendEvent.asset_id, BackendEvent.ingested_at).filter(
+                BackendEvent.kind == "indicator",
+                BackendEvent.asset_id.in_({asset_ids[t["asset_symbol"]] for _, t in batch}),
+                BackendEvent.ingested_at.in_({t["timestamp"] for _, t in batch})
+            )
+        }
+        
+        event_rows = []
+        indicator_rows = []
+        for event, transformed in batch:
+            asset_id = asset_ids[transformed["asset_symbol"]]
+            key = (asset_id, _as_utc(transformed["timestamp"]))
+            
+            # Skip events that already exist (or repeat within this batch)
+            if key in existing:
+                if debug:
+                    logger.debug("Event already exists for %s at %s", transformed["asset_symbol"], transformed["timestamp"])
+                stats["skipped"] += 1
+                continue
+            existing.add(key)
+            
+            event_rows.append({
+                "trace_id": str(uuid4()),
+                "source": "scraper_bridge",
+                "asset_id": asset_id,
+                "kind": "indicator",
+                "ingested_at": transformed["timestamp"],
+                "payload": {
+                    "key": transformed["key"],
+                    "value": transformed["value"],
+                    "metadata": transformed["metadata"]
+                }
+            })
+            indicator_rows.append({
+                "asset_id": asset_id,
+                "key": transformed["key"],
+                "ts": transformed["timestamp"],
+                "value": transformed["value"],
+                "meta": transformed["metadata"]
+            })
+            touched_assets.add(asset_id)
+            
+            stats["processed"] += 1
+            if debug:
+                logger.debug("Processed %s → %s (score: %s)", event.series_id, transformed["asset_symbol"], transformed["value"])
+        
+        if event_rows:
+            if session.get_bind().dialect.name == "postgresql":
+                self.bulk_copy_events(session, event_rows)
+            else:
+                session.execute(insert(BackendEvent), event_rows)
+            self._upsert_indicators(session, indicator_rows)
         
         return stats
+    
+    def bulk_copy_events(self, session, rows: List[Dict]) -> None:
+        """Stream event rows into PostgreSQL with COPY instead of INSERT"""
+        table = BackendEvent.__table__
+        _copy_rows(session, table.name, _with_column_defaults(session, table, rows))
+    
+    def _upsert_indicators(self, session, rows: List[Dict]) -> None:
+        """Insert indicators, replacing rows with the same primary key"""
+        if session.get_bind().dialect.name == "postgresql":
+            # COPY cannot resolve conflicts, so stage the rows in a temp table first
+            quote = session.get_bind().dialect.identifier_preparer.quote
+            table = quote(Indicator.__table__.name)
+            primary_key = [column.name for column in Indicator.__table__.primary_key.columns]
+            rows = _with_column_defaults(session, Indicator.__table__, rows)
+            columns = list(rows[0])
+            session.execute(text(
+                f"CREATE TEMP TABLE tmp_indicators (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            ))
+            _copy_rows(session, "tmp_indicators", rows)
+            column_list = ", ".join(quote(name) for name in columns)
+            updates = ", ".join(
+                f"{quote(name)} = EXCLUDED.{quote(name)}" for name in columns if name not in primary_key
+            )
+            session.execute(text(
+                f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM tmp_indicators "
+                f"ON CONFLICT ({', '.join(quote(name) for name in primary_key)}) DO UPDATE SET {updates}"
+            ))
+        else:
+            for row in rows:
+                session.merge(Indicator(**row))  # Use merge to handle duplicates
+
+def _copy_rows(session, table: str, rows: List[Dict]) -> None:
+    """COPY rows (dicts sharing the same keys) into a PostgreSQL table as CSV"""
+    quote = session.get_bind().dialect.identifier_preparer.quote
+    columns = list(rows[0])
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_copy_value(row[name]) for name in columns])
+    sql = (
+        f"COPY {quote(table)} ({', '.join(quote(name) for name in columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    
+    cursor = session.connection().connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)  # psycopg2
+        else:
+            with cursor.copy(sql) as copy:  # psycopg 3
+                copy.write(buf.getvalue())
+    finally:
+        cursor.close()
+
+def _with_column_defaults(session, table, rows: List[Dict]) -> List[Dict]:
+    """Fill the client-side column defaults that insert() applies but COPY skips (rows share the same keys)"""
+    missing = [column for column in table.c if column.default is not None and column.name not in rows[0]]
+    if not missing:
+        return rows
+    
+    filled = [dict(row) for row in rows]
+    for column in missing:
+        default = column.default
+        if default.is_sequence:
+            values = session.execute(
+                select(default.next_value()).select_from(func.generate_series(1, len(rows)))
+            ).scalars()
+        elif default.is_callable:
+            values = (default.arg(None) for _ in rows)
+        elif default.is_clause_element:
+            values = itertools.repeat(session.scalar(select(default.arg)))
+        else:
+            values = itertools.repeat(default.arg)
+        for row, value in zip(filled, values):
+            row[column.name] = value
+    return filled
+
+def _copy_value(value):
+    """Format a single value for CSV COPY input"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return _json_dumps(value)
+    return value
+
+def _engine_options(db_url: str) -> Dict:
+    """Driver-specific create_engine options for bulk writes"""
+    url = make_url(db_url)
+    options = {"json_serializer": _json_dumps}
+    if url.get_backend_name() != "sqlite":
+        # One pooled connection per bridge worker
+        options.update(pool_size=max(5, BRIDGE_PARALLEL), max_overflow=0)
+    if url.get_driver_name() == "psycopg2":
+        # Group executemany() DML into pages instead of one round trip per row
+        options.update(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+        )
+    return options
+
+def _json_dumps(value) -> str:
+    """Serialize a JSON column value, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC).decode('utf-8')
+    return json.dumps(value)
+
+def _as_utc(ts: datetime) -> datetime:
+    """Normalize a timestamp for comparison (naive values are taken as UTC)"""
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
 
 def main():
     parser = argparse.ArgumentParser(description="Bridge scraper data to backend")
@@ -289,6 +588,7 @@ def main():
     parser.add_argument("--series-id", help="Process only specific series ID")
     parser.add_argument("--scraper-db", default="scraper/events.db", help="Path to scraper SQLite database")
     parser.add_argument("--backend-db", help="Backend database URL (default from settings)")
+    parser.add_argument("--skip-scoring", action="store_true", help="Do not recompute scores after inserting events")
     
     args = parser.parse_args()
     
@@ -300,15 +600,14 @@ def main():
         backend_db_url=args.backend_db
     )
     
-    # Load events
-    events = processor.load_scraper_events(args.series_id)
-    if not events:
+    # Stream events from the scraper database and process them chunk by chunk
+    stats = processor.process_events(
+        processor.load_scraper_events(args.series_id), dry_run=args.dry_run, skip_scoring=args.skip_scoring
+    )
+    if not any(stats.values()):
         logger.warning("No events found to process")
         return
     
-    # Process events
-    stats = processor.process_events(events, dry_run=args.dry_run)
-    
     # Report results
     logger.info(f"Bridge process completed:")
     logger.info(f"  Processed: {stats['processed']}")
@@ -7,12 +7,14 @@ revisions never overwrite prior releases.  Only events with
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     series_id: str
     release_date: str  # YYYY-MM-DD
@@ -25,12 +27,66 @@ class Event:
     provider: str
 
 
+def _event_factory(cursor: sqlite3.Cursor, row: tuple) -> Event:
+    """sqlite3 row factory building :class:`Event` objects."""
+    return Event(*row)
+
+
 class EventStore:
     """SQLite backed store tracking event revisions."""
 
+    _INSERT_SQL = """
+        INSERT OR REPLACE INTO events
+        (series_id, release_date, vintage, actual, consensus, previous,
+         impact, release_time_utc, provider)
+        VALUES (?,?,?,?,?,?,?,?,?)
+        """
+
+    # A negative LIMIT means no limit in SQLite
+    _FETCH_SQL = """
+        SELECT series_id, release_date, vintage, actual, consensus, previous,
+               impact, release_time_utc, provider
+        FROM events
+        WHERE series_id = ? AND release_time_utc <= ?
+        ORDER BY release_date ASC, vintage ASC
+        LIMIT ?
+        """
+
     def __init__(self, path: str = "events.db") -> None:
-        self.conn = sqlite3.connect(path)
+        # Autocommit mode; write transactions are opened with transaction()
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        # WAL lets readers run during writes; NORMAL only fsyncs at checkpoints
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self._init_db()
+        # Separate read-only connection so reads do not contend with the writer
+        if path == ":memory:":
+            self._reader = self.conn
+        else:
+            self._reader = sqlite3.connect(
+                Path(path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+            )
+
+    def close(self) -> None:
+        """Close the reader and writer connections."""
+        if self._reader is not self.conn:
+            self._reader.close()
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed writes in one transaction (joins an already open one)."""
+        if self.conn.in_transaction:
+            yield self.conn
+            return
+        self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def _init_db(self) -> None:
         self.conn.execute(
@@ -49,49 +105,76 @@ class EventStore:
             )
             """
         )
-        self.conn.commit()
+        indexes = {
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND name IN ('idx_events_series_time', 'idx_events_release_time')"
+            )
+        }
+        if 'idx_events_series_time' not in indexes:
+            # Covers the fetch_events filter so lookups are an index range seek
+            self.conn.execute(
+                """
+                CREATE INDEX idx_events_series_time
+                ON events(series_id, release_time_utc, release_date, vintage)
+                """
+            )
+        if 'idx_events_release_time' not in indexes:
+            # Lets the monitoring freshness check read MAX(release_time_utc) from the index
+            self.conn.execute(
+                """
+                CREATE INDEX idx_events_release_time
+                ON events(release_time_utc) WHERE release_time_utc IS NOT NULL
+                """
+            )
+        if len(indexes) < 2:
+            self.conn.execute("ANALYZE")
 
     def add_event(self, event: Event) -> None:
         """Insert a new event if its release time is not in the future."""
-        rt = datetime.fromisoformat(event.release_time_utc)
-        if rt > datetime.now(timezone.utc):
-            raise ValueError("release_time_utc is in the future")
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO events
-            (series_id, release_date, vintage, actual, consensus, previous,
-             impact, release_time_utc, provider)
-            VALUES (?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                event.series_id,
-                event.release_date,
-                event.vintage,
-                event.actual,
-                event.consensus,
-                event.previous,
-                event.impact,
-                event.release_time_utc,
-                event.provider,
-            ),
-        )
-        self.conn.commit()
+        self.add_events([event])
+
+    def add_events(self, events: Iterable[Event]) -> None:
+        """Insert events in one transaction, rejecting any with a future release time.
+
+        Inside an open :meth:`transaction`, nothing is committed here.
+        """
+        now = datetime.now(timezone.utc)
+        rows = []
+        for event in events:
+            if datetime.fromisoformat(event.release_time_utc) > now:
+                raise ValueError("release_time_utc is in the future")
+            rows.append(
+                (
+                    event.series_id,
+                    event.release_date,
+                    event.vintage,
+                    event.actual,
+                    event.consensus,
+                    event.previous,
+                    event.impact,
+                    event.release_time_utc,
+                    event.provider,
+                )
+            )
+        with self.transaction():
+            self.conn.executemany(self._INSERT_SQL, rows)
 
     def fetch_events(
-        self, series_id: str, as_of: Optional[datetime] = None
+        self,
+        series_id: str,
+        as_of: Optional[datetime] = None,
+        limit: Optional[int] = None,
     ) -> Iterable[Event]:
-        """Yield events for ``series_id`` with release_time_utc <= ``as_of``."""
+        """Yield events for ``series_id`` with release_time_utc <= ``as_of``.
+
+        At most ``limit`` events are returned when it is given.
+        """
         if as_of is None:
             as_of = datetime.now(timezone.utc)
-        cur = self.conn.execute(
-            """
-            SELECT series_id, release_date, vintage, actual, consensus, previous,
-                   impact, release_time_utc, provider
-            FROM events
-            WHERE series_id = ? AND release_time_utc <= ?
-            ORDER BY release_date ASC, vintage ASC
-            """,
-            (series_id, as_of.isoformat()),
+        cur = self._reader.cursor()
+        cur.row_factory = _event_factory
+        yield from cur.execute(
+            self._FETCH_SQL,
+            (series_id, as_of.isoformat(), -1 if limit is None else limit),
         )
-        for row in cur.fetchall():
-            yield Event(*row)
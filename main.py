@@ -1,8 +1,6 @@
 """Example workflow fetching data, storing events and computing scores."""
 from __future__ import annotations
 
-from dataclasses import asdict
-
 from event_store import Event, EventStore
 from normalizer import normalize_units
 from providers import FredProvider, ProviderRegistry, WorldBankProvider
@@ -16,20 +14,23 @@ def run() -> None:
     registry = ProviderRegistry()
     wb_map = {SERIES_ID: ("USA", "FP.CPI.TOTL.ZG")}
     fred_map = {SERIES_ID: "CPIAUCSL"}
-    registry.register(SERIES_ID, [FredProvider(fred_map), WorldBankProvider(wb_map)])
+    registry.register(SERIES_ID, [
+        FredProvider(fred_map, session=registry.session),
+        WorldBankProvider(wb_map, session=registry.session),
+    ])
     store = EventStore()
 
-    payload = normalize_units(asdict(registry.fetch(SERIES_ID)))
+    payload = normalize_units(registry.fetch(SERIES_ID))
     event = Event(
         series_id=SERIES_ID,
-        release_date=payload["release_time_utc"][:10],
+        release_date=payload.release_time_utc[:10],
         vintage="final",
-        actual=payload["actual"],
-        consensus=payload["consensus"],
-        previous=payload["previous"],
-        impact=payload["impact"],
-        release_time_utc=payload["release_time_utc"],
-        provider=payload["provider"],
+        actual=payload.actual,
+        consensus=payload.consensus,
+        previous=payload.previous,
+        impact=payload.impact,
+        release_time_utc=payload.release_time_utc,
+        provider=payload.provider,
     )
     store.add_event(event)
 
@@ -14,17 +14,60 @@ import asyncio
 import logging
 import json
 import time
-import psutil
-import requests
+from collections import Counter, deque
+from itertools import takewhile
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+from dataclasses import dataclass, asdict, is_dataclass
 from pathlib import Path
 import sqlite3
-import yaml
+import threading
+
+try:
+    import orjson  # optional: faster JSON output
+except ImportError:
+    orjson = None
+
+# httpx, psutil and yaml are imported on first use so that importing this
+# module (or running --dashboard) does not pay for them
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+# Scraper event database probed by the database and freshness checks
+SCRAPER_DB_PATH = "scraper/events.db"
+
+# Number of resolved alerts kept for the dashboard
+ALERT_HISTORY_LIMIT = 1000
+
+# Minimum seconds between psutil samples; checks in between reuse the last one
+_PSUTIL_MIN_INTERVAL = 2.0
+
+_http_client: Optional["httpx.AsyncClient"] = None
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Process-wide HTTP client shared by the health checks and notifiers"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+        _http_client = httpx.AsyncClient(timeout=10)
+    return _http_client
+
+def _json_default(value: Any) -> Any:
+    """Encode dataclasses and datetimes for the json fallback"""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data (which may contain dataclasses and datetimes) to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
 @dataclass
 class HealthMetric:
     """Health metric data point"""
@@ -50,7 +93,17 @@ class SystemAlert:
 class HealthChecker:
     """Performs various health checks"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional["httpx.AsyncClient"] = None):
+        # Reused across check cycles so the API probe keeps its connection alive
+        self._http_client = http_client
+        
+        self._psutil_cache = {"ts": 0.0, "cpu": None, "mem": None, "disk": None}
+        self._psutil_lock = asyncio.Lock()
+        
+        # Long-lived scraper database connection, opened on first use
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        
         self.checks = {
             'system_cpu': self.check_cpu_usage,
             'system_memory': self.check_memory_usage,
@@ -61,16 +114,17 @@ class HealthChecker:
         }
     
     async def run_all_checks(self) -> List[HealthMetric]:
-        """Run all health checks"""
+        """Run all health checks concurrently"""
         metrics = []
         
-        for check_name, check_func in self.checks.items():
-            try:
-                metric = await check_func()
-                if metric:
-                    metrics.append(metric)
-            except Exception as e:
-                logger.error(f"Health check {check_name} failed: {e}")
+        results = await asyncio.gather(
+            *(check_func() for check_func in self.checks.values()),
+            return_exceptions=True
+        )
+        
+        for check_name, result in zip(self.checks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Health check {check_name} failed: {result}")
                 metrics.append(HealthMetric(
                     name=check_name,
                     value=-1,
@@ -78,12 +132,37 @@ class HealthChecker:
                     timestamp=datetime.now(),
                     status="CRITICAL"
                 ))
+            elif isinstance(result, BaseException):
+                raise result  # cancellation and interrupts are not check failures
+            elif result:
+                metrics.append(result)
         
         return metrics
     
+    @property
+    def http_client(self) -> "httpx.AsyncClient":
+        return self._http_client or _get_http_client()
+    
+    async def _system_stats(self) -> Dict[str, Any]:
+        """Sample CPU, memory and disk together, at most once per _PSUTIL_MIN_INTERVAL"""
+        async with self._psutil_lock:
+            cache = self._psutil_cache
+            if time.monotonic() - cache["ts"] >= _PSUTIL_MIN_INTERVAL:
+                cpu, mem, disk = await asyncio.to_thread(self._sample_system, cache["cpu"] is None)
+                cache.update(ts=time.monotonic(), cpu=cpu, mem=mem, disk=disk)
+            return cache
+    
+    @staticmethod
+    def _sample_system(first: bool) -> tuple:
+        """Sample CPU, memory and disk usage (blocking)"""
+        import psutil
+        # CPU percent is measured since the previous call, so only the first sample needs to wait
+        cpu = psutil.cpu_percent(interval=1 if first else None)
+        return cpu, psutil.virtual_memory(), psutil.disk_usage('/')
+    
     async def check_cpu_usage(self) -> HealthMetric:
         """Check CPU usage"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = (await self._system_stats())["cpu"]
         
         status = "OK"
         if cpu_percent > 90:
@@ -103,7 +182,7 @@ class HealthChecker:
     
     async def check_memory_usage(self) -> HealthMetric:
         """Check memory usage"""
-        memory = psutil.virtual_memory()
+        memory = (await self._system_stats())["mem"]
         memory_percent = memory.percent
         
         status = "OK"
@@ -124,7 +203,7 @@ class HealthChecker:
     
     async def check_disk_usage(self) -> HealthMetric:
         """Check disk usage"""
-        disk = psutil.disk_usage('/')
+        disk = (await self._system_stats())["disk"]
         disk_percent = (disk.used / disk.total) * 100
         
         status = "OK"
@@ -147,7 +226,7 @@ class HealthChecker:
         """Check backend API health"""
         try:
             start_time = time.time()
-            response = requests.get("http://localhost:8000/health", timeout=10)
+            response = await self.http_client.get("http://localhost:8000/health", timeout=10)
             response_time = (time.time() - start_time) * 1000  # ms
             
             status = "OK"
@@ -182,10 +261,9 @@ class HealthChecker:
         """Check database connectivity"""
         try:
             # Check SQLite scraper database
-            conn = sqlite3.connect("scraper/events.db", timeout=5)
-            cursor = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
-            table_count = cursor.fetchone()[0]
-            conn.close()
+            table_count = (await asyncio.to_thread(
+                self._query_db, "SELECT COUNT(*) FROM sqlite_master WHERE type='table'"
+            ))[0]
             
             status = "OK" if table_count > 0 else "WARNING"
             
@@ -210,13 +288,10 @@ class HealthChecker:
     async def check_data_freshness(self) -> HealthMetric:
         """Check how fresh the scraped data is"""
         try:
-            conn = sqlite3.connect("scraper/events.db")
-            cursor = conn.execute("""
+            result = await asyncio.to_thread(self._query_db, """
                 SELECT MAX(release_time_utc) FROM events 
                 WHERE release_time_utc IS NOT NULL
             """)
-            result = cursor.fetchone()
-            conn.close()
             
             if result[0]:
                 latest_data = datetime.fromisoformat(result[0].replace('Z', '+00:00'))
@@ -256,77 +331,120 @@ class HealthChecker:
                 status="CRITICAL"
             )
 
+    def _query_db(self, sql: str) -> tuple:
+        """Run a single-row query on the shared scraper database connection (blocking)"""
+        with self._db_lock:
+            if self._db is None:
+                # Read-only, and only connection-local pragmas: the scraper owns this database
+                uri = Path(SCRAPER_DB_PATH).resolve().as_uri() + "?mode=ro"
+                conn = sqlite3.connect(uri, uri=True, timeout=5, check_same_thread=False)
+                try:
+                    conn.execute("PRAGMA busy_timeout=5000")
+                    conn.execute("PRAGMA cache_size=-20000")
+                    conn.execute("PRAGMA temp_store=MEMORY")
+                except sqlite3.Error:
+                    conn.close()
+                    raise
+                self._db = conn
+            try:
+                return self._db.execute(sql).fetchone()
+            except sqlite3.Error:
+                # Reconnect on the next check in case the file was replaced
+                self._db.close()
+                self._db = None
+                raise
+    
+    def close(self):
+        """Close the scraper database connection"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
 class AlertManager:
     """Manages alerts and notifications"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], http_client: Optional["httpx.AsyncClient"] = None):
         self.config = config
-        self.active_alerts = {}
-        self.alert_history = []
+        self._http_client = http_client
+        # Active alerts keyed by metric name; severity is stored on the alert
+        self.active_alerts: Dict[str, SystemAlert] = {}
+        self.alert_history: deque = deque(maxlen=ALERT_HISTORY_LIMIT)
+    
+    @property
+    def http_client(self) -> "httpx.AsyncClient":
+        return self._http_client or _get_http_client()
     
     def process_metrics(self, metrics: List[HealthMetric]) -> List[SystemAlert]:
         """Process metrics and generate alerts"""
         new_alerts = []
         
         for metric in metrics:
-            alert_id = f"{metric.name}_{metric.status}"
+            active = self.active_alerts.get(metric.name)
             
-            if metric.status in ["WARNING", "CRITICAL"]:
-                if alert_id not in self.active_alerts:
-                    # New alert
-                    alert = SystemAlert(
-                        id=alert_id,
-                        severity=metric.status,
-                        component=metric.name,
-                        message=f"{metric.name} is {metric.status}: {metric.value} {metric.unit}",
-                        timestamp=metric.timestamp
-                    )
-                    self.active_alerts[alert_id] = alert
-                    new_alerts.append(alert)
-                    logger.warning(f"New alert: {alert.message}")
-            else:
-                # Check if we need to resolve an existing alert
-                if alert_id.replace("_OK", "_WARNING") in self.active_alerts:
-                    resolved_alert = self.active_alerts.pop(alert_id.replace("_OK", "_WARNING"))
-                    resolved_alert.resolved = True
-                    resolved_alert.resolution_time = metric.timestamp
-                    self.alert_history.append(resolved_alert)
-                    logger.info(f"Resolved alert: {resolved_alert.message}")
-                
-                if alert_id.replace("_OK", "_CRITICAL") in self.active_alerts:
-                    resolved_alert = self.active_alerts.pop(alert_id.replace("_OK", "_CRITICAL"))
-                    resolved_alert.resolved = True
-                    resolved_alert.resolution_time = metric.timestamp
-                    self.alert_history.append(resolved_alert)
-                    logger.info(f"Resolved alert: {resolved_alert.message}")
+            if metric.status in ("WARNING", "CRITICAL"):
+                if active is not None and active.severity == metric.status:
+                    continue
+                if active is not None:
+                    # Severity changed: close the old alert and raise a new one
+                    self._resolve(active, metric.timestamp)
+                alert = SystemAlert(
+                    id=f"{metric.name}_{metric.status}",
+                    severity=metric.status,
+                    component=metric.name,
+                    message=f"{metric.name} is {metric.status}: {metric.value} {metric.unit}",
+                    timestamp=metric.timestamp
+                )
+                self.active_alerts[metric.name] = alert
+                new_alerts.append(alert)
+                logger.warning(f"New alert: {alert.message}")
+            elif active is not None:
+                del self.active_alerts[metric.name]
+                self._resolve(active, metric.timestamp)
+                logger.info(f"Resolved alert: {active.message}")
         
         return new_alerts
     
+    def _resolve(self, alert: SystemAlert, resolution_time: datetime):
+        """Mark an alert resolved and move it to the history"""
+        alert.resolved = True
+        alert.resolution_time = resolution_time
+        self.alert_history.append(alert)
+    
     async def send_notifications(self, alerts: List[SystemAlert]):
         """Send notifications for new alerts"""
         if not self.config.get('notifications', {}).get('enabled', False):
             return
         
-        for alert in alerts:
-            try:
-                await self._send_alert_notification(alert)
-            except Exception as e:
-                logger.error(f"Failed to send notification for alert {alert.id}: {e}")
+        results = await asyncio.gather(
+            *(self._send_alert_notification(alert) for alert in alerts),
+            return_exceptions=True
+        )
+        for alert, result in zip(alerts, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send notification for alert {alert.id}: {result}")
     
     async def _send_alert_notification(self, alert: SystemAlert):
         """Send notification for a single alert"""
         # Log notification (always enabled)
         logger.error(f"ALERT [{alert.severity}] {alert.component}: {alert.message}")
         
+        notifications = []
+        
         # Email notification
         email_config = self.config.get('notifications', {}).get('email', {})
         if email_config.get('enabled', False):
-            await self._send_email_notification(alert, email_config)
+            notifications.append(self._send_email_notification(alert, email_config))
         
         # Webhook notification
         webhook_config = self.config.get('notifications', {}).get('webhook', {})
         if webhook_config.get('enabled', False):
-            await self._send_webhook_notification(alert, webhook_config)
+            notifications.append(self._send_webhook_notification(alert, webhook_config))
+        
+        # Channels are independent; the first failure is raised once all have finished
+        for result in await asyncio.gather(*notifications, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
     
     async def _send_email_notification(self, alert: SystemAlert, config: Dict[str, Any]):
         """Send email notification"""
@@ -344,10 +462,10 @@ class AlertManager:
                 "timestamp": alert.timestamp.isoformat()
             }
             
-            response = requests.post(
+            response = await self.http_client.post(
                 config['url'],
-                json=payload,
-                headers=config.get('headers', {}),
+                content=dumps_json(payload),
+                headers={"Content-Type": "application/json", **config.get('headers', {})},
                 timeout=10
             )
             response.raise_for_status()
@@ -365,10 +483,19 @@ class MonitoringSystem:
         self.health_checker = HealthChecker()
         self.alert_manager = AlertManager(self.config)
         self.running = False
-        self.metrics_history = []
+        # Appended in check order, so the oldest metrics are always at the left
+        self.metrics_history: deque = deque()
+    
+    async def aclose(self):
+        """Close the shared HTTP client and the health checker's database connection"""
+        if _http_client is not None:
+            await _http_client.aclose()
+        self.health_checker.close()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load monitoring configuration"""
+        import yaml
+        
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
@@ -412,8 +539,9 @@ class MonitoringSystem:
                     await self.alert_manager.send_notifications(new_alerts)
                 
                 # Log summary
-                critical_count = sum(1 for m in metrics if m.status == "CRITICAL")
-                warning_count = sum(1 for m in metrics if m.status == "WARNING")
+                status_counts = Counter(m.status for m in metrics)
+                critical_count = status_counts["CRITICAL"]
+                warning_count = status_counts["WARNING"]
                 
                 if critical_count > 0 or warning_count > 0:
                     logger.warning(f"Health check summary: {critical_count} critical, {warning_count} warnings")
@@ -433,23 +561,24 @@ class MonitoringSystem:
         retention_hours = self.config.get('metrics_retention_hours', 24)
         cutoff_time = datetime.now() - timedelta(hours=retention_hours)
         
-        self.metrics_history = [
-            m for m in self.metrics_history 
-            if m.timestamp > cutoff_time
-        ]
+        history = self.metrics_history
+        while history and history[0].timestamp <= cutoff_time:
+            history.popleft()
     
     def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get data for monitoring dashboard"""
-        recent_metrics = [
-            m for m in self.metrics_history 
-            if m.timestamp > datetime.now() - timedelta(hours=1)
-        ]
+        """Get data for monitoring dashboard (alerts and metrics as dataclasses, see dumps_json)"""
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=1)
+        
+        # Walk back from the newest metric only as far as the last hour
+        recent_metrics = list(takewhile(lambda m: m.timestamp > cutoff_time, reversed(self.metrics_history)))
+        recent_metrics.reverse()
         
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'system_status': self._get_overall_status(recent_metrics),
-            'active_alerts': [asdict(alert) for alert in self.alert_manager.active_alerts.values()],
-            'recent_metrics': [asdict(m) for m in recent_metrics[-20:]],  # Last 20 metrics
+            'active_alerts': list(self.alert_manager.active_alerts.values()),
+            'recent_metrics': recent_metrics[-20:],  # Last 20 metrics
             'summary': {
                 'total_metrics': len(self.metrics_history),
                 'active_alerts': len(self.alert_manager.active_alerts),
@@ -462,19 +591,19 @@ class MonitoringSystem:
         if not metrics:
             return "UNKNOWN"
         
-        latest_metrics = {}
-        for metric in metrics:
-            if metric.name not in latest_metrics or metric.timestamp > latest_metrics[metric.name].timestamp:
-                latest_metrics[metric.name] = metric
-        
-        statuses = [m.status for m in latest_metrics.values()]
+        # Metrics are in append order, so the first one seen per name from the end is its latest
+        seen = set()
+        status = "OK"
+        for metric in reversed(metrics):
+            if metric.name in seen:
+                continue
+            seen.add(metric.name)
+            if metric.status == "CRITICAL":
+                return "CRITICAL"
+            if metric.status == "WARNING":
+                status = "WARNING"
         
-        if "CRITICAL" in statuses:
-            return "CRITICAL"
-        elif "WARNING" in statuses:
-            return "WARNING"
-        else:
-            return "OK"
+        return status
 
 async def main():
     """Main entry point"""
@@ -490,7 +619,8 @@ async def main():
     
     if args.dashboard:
         dashboard_data = monitoring.get_dashboard_data()
-        print(json.dumps(dashboard_data, indent=2, default=str))
+        print(dumps_json(dashboard_data, indent=True).decode('utf-8'))
+        await monitoring.aclose()
         return
     
     try:
@@ -500,6 +630,8 @@ async def main():
     except Exception as e:
         logger.error(f"Monitoring error: {e}")
         return 1
+    finally:
+        await monitoring.aclose()
     
     return 0
 
@@ -1,17 +1,44 @@
 """Utilities to normalize raw event payloads."""
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, Optional
+from dataclasses import replace
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Dict, Optional, TypeVar, Union
 
 from dateutil import parser, tz
 
+from providers import EventPayload
 
-def normalize_units(payload: Dict) -> Dict:
-    """Normalize units such as percentages to ratios."""
+PERCENT_UNITS = frozenset({"%", "percent", "percentage"})
+
+P = TypeVar("P", bound=Union[Dict, EventPayload])
+
+
+def _ratio(value: Optional[float]) -> Optional[float]:
+    return float(value) / 100.0 if value is not None else None
+
+
+def normalize_units(payload: P) -> P:
+    """Normalize units such as percentages to ratios.
+
+    Dicts are updated in place; an :class:`EventPayload` is returned unchanged
+    when no conversion is needed, otherwise as a converted copy.
+    """
+
+    if isinstance(payload, EventPayload):
+        if payload.unit.lower() not in PERCENT_UNITS:
+            return payload
+        return replace(
+            payload,
+            actual=_ratio(payload.actual),
+            consensus=_ratio(payload.consensus),
+            previous=_ratio(payload.previous),
+            unit="ratio",
+        )
 
     unit = payload.get("unit", "").lower()
-    if unit in {"%", "percent", "percentage"}:
+    if unit in PERCENT_UNITS:
         for key in ["actual", "consensus", "previous"]:
             if payload.get(key) is not None:
                 payload[key] = float(payload[key]) / 100.0
@@ -19,10 +46,19 @@ def normalize_units(payload: Dict) -> Dict:
     return payload
 
 
+@lru_cache(maxsize=64)
+def _gettz(name: str) -> Optional[tzinfo]:
+    return tz.gettz(name)
+
+
 def to_utc(local_ts: str, source_tz: Optional[str] = None) -> str:
     """Convert a timestamp in ``source_tz`` to UTC (DST safe)."""
 
-    dt = parser.isoparse(local_ts)
+    try:
+        dt = datetime.fromisoformat(local_ts)
+    except ValueError:
+        # Forms the stdlib parser rejects still go through dateutil
+        dt = parser.isoparse(local_ts)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=tz.gettz(source_tz or "UTC"))
+        dt = dt.replace(tzinfo=_gettz(source_tz or "UTC"))
     return dt.astimezone(tz.UTC).isoformat().replace("+00:00", "Z")
@@ -8,11 +8,29 @@ logic.  No Trading Economics usage per specs.
 from __future__ import annotations
 
 import os
-import statistics
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds for provider requests
+TIMEOUT = (3, 10)
+
+
+def make_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections and retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 @dataclass
@@ -35,12 +53,13 @@ class WorldBankProvider:
         "https://api.worldbank.org/v2/country/{country}/indicator/{indicator}?format=json"
     )
 
-    def __init__(self, mapping: Dict[str, Tuple[str, str]]):
+    def __init__(self, mapping: Dict[str, Tuple[str, str]], session: Optional[requests.Session] = None):
         self.mapping = mapping
+        self.session = session or make_session()
 
     def fetch(self, series_id: str) -> EventPayload:
         country, indicator = self.mapping[series_id]
-        resp = requests.get(self.BASE_URL.format(country=country, indicator=indicator))
+        resp = self.session.get(self.BASE_URL.format(country=country, indicator=indicator), timeout=TIMEOUT)
         resp.raise_for_status()
         payload = resp.json()[1]
         data = payload[0]
@@ -66,9 +85,15 @@ class FredProvider:
 
     BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 
-    def __init__(self, mapping: Dict[str, str], api_key: Optional[str] = None):
+    def __init__(
+        self,
+        mapping: Dict[str, str],
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.mapping = mapping
         self.api_key = api_key or os.getenv("FRED_API_KEY")
+        self.session = session or make_session()
 
     def fetch(self, series_id: str) -> EventPayload:
         if not self.api_key:
@@ -81,10 +106,13 @@ class FredProvider:
             "sort_order": "desc",
             "limit": 2,
         }
-        resp = requests.get(self.BASE_URL, params=params)
+        resp = self.session.get(self.BASE_URL, params=params, timeout=TIMEOUT)
         resp.raise_for_status()
         data = resp.json()["observations"]
-        latest, prev = data[0], data[1] if len(data) > 1 else ({"value": None, "date": None})
+        if not data:
+            raise RuntimeError(f"FRED returned no observations for {fred_id}")
+        latest = data[0]
+        prev = data[1] if len(data) > 1 else {"value": None, "date": None}
         value = float(latest["value"])
         previous = float(prev["value"]) if prev["value"] not in (None, ".") else None
         date = latest["date"]
@@ -106,6 +134,8 @@ class ProviderRegistry:
 
     def __init__(self) -> None:
         self._providers: Dict[str, List[object]] = {}
+        # Shared with the providers so connections are reused across fetches
+        self.session = make_session()
 
     def register(self, series_id: str, providers: List[object]) -> None:
         self._providers[series_id] = providers
@@ -117,3 +147,20 @@ class ProviderRegistry:
             except Exception:
                 continue
         raise RuntimeError(f"no provider could fetch series {series_id}")
+
+    def fetch_many(self, series_ids: List[str]) -> Dict[str, EventPayload]:
+        """Fetch several series concurrently.
+
+        Series that no provider could fetch are left out of the result.
+        """
+        if not series_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(16, len(series_ids))) as pool:
+            futures = {series_id: pool.submit(self.fetch, series_id) for series_id in series_ids}
+        results = {}
+        for series_id, future in futures.items():
+            try:
+                results[series_id] = future.result()
+            except RuntimeError:
+                continue
+        return results
@@ -4,13 +4,18 @@ from __future__ import annotations
 import math
 import statistics
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from event_store import Event, EventStore
 
 IMPACT_WEIGHT = {"high": 3.0, "mid": 1.5, "low": 0.75}
 HALF_LIFE = {"w": 14, "m": 45, "q": 90, "policy": 90}
 
+# Per-day log decay rate, ln(0.5) / half-life, so decay is a single exp()
+DECAY_RATE = {freq: math.log(0.5) / hl for freq, hl in HALF_LIFE.items()}
+DEFAULT_DECAY_RATE = math.log(0.5) / 30
+
 
 def surprise(event: Event, direction: str) -> float:
     if event.consensus is None:
@@ -28,11 +33,15 @@ def z_score(series_id: str, surprises: List[float]) -> float:
     return (surprises[-1] - mu) / sigma
 
 
-def decay_weight(release_time: str, freq: str, impact: str) -> float:
-    rt = datetime.fromisoformat(release_time)
-    days = (datetime.now(timezone.utc) - rt).days
-    hl = HALF_LIFE.get(freq, 30)
-    decay = 0.5 ** (days / hl)
+@lru_cache(maxsize=4096)
+def _parse_release_time(release_time: str) -> datetime:
+    return datetime.fromisoformat(release_time)
+
+
+def decay_weight(release_time: str, freq: str, impact: str, now: Optional[datetime] = None) -> float:
+    rt = _parse_release_time(release_time)
+    days = ((now or datetime.now(timezone.utc)) - rt).days
+    decay = math.exp(days * DECAY_RATE.get(freq, DEFAULT_DECAY_RATE))
     return decay * IMPACT_WEIGHT.get(impact, 1.0)
 
 
@@ -42,14 +51,23 @@ def point_from_z(z: float) -> float:
     return max(-2.0, min(2.0, 2 * math.tanh(z / 1.5)))
 
 
-def category_score(events: Iterable[Tuple[Event, str]]) -> float:
-    surprises = []
+def category_score(events: Iterable[Tuple[Event, str]], now: Optional[datetime] = None) -> float:
+    # Running mean/variance (Welford) of the surprises seen so far, including the
+    # current one; equivalent to z_score over the growing list but O(1) per event
+    n = 0
+    mu = 0.0
+    m2 = 0.0
     weights = []
+    now = now or datetime.now(timezone.utc)
     for ev, freq in events:
         s = surprise(ev, "relative") if "%" in str(ev.actual) else surprise(ev, "absolute")
-        z = z_score(ev.series_id, surprises + [s])
-        w = decay_weight(ev.release_time_utc, freq, ev.impact)
-        surprises.append(s)
+        n += 1
+        delta = s - mu
+        mu += delta / n
+        m2 += delta * (s - mu)
+        sigma = math.sqrt(m2 / n) or 1.0
+        z = (s - mu) / sigma
+        w = decay_weight(ev.release_time_utc, freq, ev.impact, now)
         weights.append(z * w)
     if not weights:
         return 0.0